@@ -1,8 +1,10 @@
 """YouTube Video Summarizer CLI application."""
 
 import argparse
+import importlib
 import logging
 import sys
+from typing import TYPE_CHECKING, Any
 
 from yt_summary.cache import is_legacy_filename, load_cache, save_to_cache
 from yt_summary.config import (
@@ -10,12 +12,40 @@ from yt_summary.config import (
     load_config,
 )
 from yt_summary.logging import setup_logging
-from yt_summary.metadata import MetadataError, fetch_video_metadata
-from yt_summary.transcript import TranscriptError, fetch_transcript
 from yt_summary.youtube_utils import extract_video_id, is_video_id
 
+if TYPE_CHECKING:
+    from yt_summary.metadata import MetadataError, fetch_video_metadata
+    from yt_summary.transcript import TranscriptError, fetch_transcript
+
 logger = logging.getLogger(__name__)
 
+# Modules that pull in yt-dlp are imported on first use so that --help and
+# invalid input return without paying for the yt-dlp import
+_LAZY_IMPORTS = {
+    "MetadataError": "yt_summary.metadata",
+    "fetch_video_metadata": "yt_summary.metadata",
+    "TranscriptError": "yt_summary.transcript",
+    "fetch_transcript": "yt_summary.transcript",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve lazily imported names on first module attribute access (PEP 562)."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def _load_lazy_imports() -> None:
+    """Bind lazily imported names not yet loaded (or replaced by tests) as globals."""
+    for name in _LAZY_IMPORTS:
+        if name not in globals():
+            __getattr__(name)
+
 
 def parse_args(args: list[str] | None = None) -> argparse.Namespace:
     """Parse command-line arguments."""
@@ -50,6 +80,7 @@ def summarize_video(url_or_id: str, lang: str | None) -> int:
             return 1
 
     lang_code = lang or get_transcript_language()
+    _load_lazy_imports()
 
     try:
         # Check cache
@@ -61,27 +92,31 @@ def summarize_video(url_or_id: str, lang: str | None) -> int:
         title = cached_title
         channel = cached_channel
         needs_metadata = (not title or not channel) and not full_text
-        needs_reorganize = cached and is_legacy_filename(video_id)
+        needs_reorganize = bool(cached) and is_legacy_filename(video_id)
 
-        if needs_metadata or needs_reorganize:
+        # A legacy file that already records title and channel can be moved without
+        # asking YouTube for metadata again
+        if (needs_metadata or needs_reorganize) and not (title and channel):
             try:
                 metadata = fetch_video_metadata(video_id)
                 title = metadata["title"]
                 channel = metadata["channel"]
                 logger.info("Fetched video metadata: %s by %s", title, channel or "Unknown")
-                if cached and is_legacy_filename(video_id):
-                    save_to_cache(
-                        video_id,
-                        full_text or "",
-                        cached.get("summary", "") if cached else "",
-                        title=title,
-                        channel=channel,
-                    )
-                    logger.info("Reorganized cache file with channel subdirectory")
             except MetadataError as e:
                 logger.warning(e.message)
                 title = cached_title or ""
                 channel = cached_channel or ""
+                needs_reorganize = False
+
+        if cached and needs_reorganize:
+            save_to_cache(
+                video_id,
+                full_text or "",
+                cached.get("summary", ""),
+                title=title or "",
+                channel=channel or "",
+            )
+            logger.info("Reorganized cache file with channel subdirectory")
 
         if full_text:
             logger.info("Transcript already cached for %s", video_id)
@@ -90,7 +125,7 @@ def summarize_video(url_or_id: str, lang: str | None) -> int:
             save_to_cache(video_id, full_text, "", title=title, channel=channel)
             logger.info("Fetched and cached transcript for %s", video_id)
 
-        print("Transcript cached. Use the yt-summary skill to summarize.")
+        logger.info("Transcript cached. Use the yt-summary skill to summarize.")
         return 0
 
     except TranscriptError as e:
@@ -101,11 +136,18 @@ def summarize_video(url_or_id: str, lang: str | None) -> int:
         return 1
 
 
-def main() -> int:
-    """Run the YouTube video summarizer CLI."""
+def main(argv: list[str] | None = None) -> int:
+    """Run the YouTube video summarizer CLI.
+
+    Args:
+        argv: Command-line arguments (None = use sys.argv)
+
+    Returns:
+        Exit code (0 for success, 1 for error)
+    """
     setup_logging()
     load_config()
-    args = parse_args()
+    args = parse_args(argv)
     return summarize_video(args.url_or_id, args.lang)
 
 
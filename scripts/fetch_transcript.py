@@ -30,7 +30,7 @@ def main() -> None:
     load_config()
 
     # Determine video ID
-    if len(arg) == 11 and "/" not in arg and "." not in arg:
+    if youtube_utils.is_video_id(arg):
         video_id = arg
     else:
         video_id = youtube_utils.extract_video_id(arg)
@@ -4,6 +4,8 @@ import json
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 from yt_summary.cache import _find_cache_file, is_legacy_filename, load_cache, save_to_cache
 
 
@@ -104,6 +106,21 @@ Sample transcript
         assert result["video_id"] == "test_video"
         assert result["full_text"] == "Sample transcript"
 
+    def test_load_cache_legacy_json_migration_disabled(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Leave legacy JSON in place when migration on load is disabled."""
+        cache_file = tmp_path / "test_video.json"
+        cache_file.write_text(json.dumps({"video_id": "test_video", "full_text": "Transcript"}))
+        monkeypatch.setattr("yt_summary.cache.MIGRATE_ON_LOAD", False)
+
+        with patch("yt_summary.cache.get_obsidian_vault_path", return_value=tmp_path):
+            result = load_cache("test_video")
+
+        assert result["full_text"] == "Transcript"
+        assert cache_file.exists()
+        assert not (tmp_path / "Summaries").exists()
+
     def test_load_cache_nonexistent_file(self, tmp_path: Path) -> None:
         """Return None when cache file doesn't exist."""
         with patch("yt_summary.cache.get_obsidian_vault_path", return_value=tmp_path):
@@ -813,22 +830,24 @@ Transcript content
         assert "Transcript content" in result["full_text"]
         assert "Summary content" in result["summary"]
 
-    def test_load_cache_with_legacy_json_format(self, tmp_path: Path) -> None:
+    def test_load_cache_with_legacy_json_format(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Load cache from legacy JSON format file."""
         cache_file = tmp_path / "abc123.json"
         test_data = {"video_id": "abc123", "full_text": "Transcript", "summary": "Summary"}
         cache_file.write_text(json.dumps(test_data))
+        monkeypatch.setattr("yt_summary.cache.MIGRATE_ON_LOAD", False)
 
-        with (
-            patch("yt_summary.cache.get_obsidian_vault_path", return_value=tmp_path),
-            patch("yt_summary.cache.save_to_cache"),
-        ):
+        with patch("yt_summary.cache.get_obsidian_vault_path", return_value=tmp_path):
             result = load_cache("abc123")
 
         assert result["video_id"] == "abc123"
         assert result["full_text"] == "Transcript"
 
-    def test_load_cache_finds_either_format(self, tmp_path: Path) -> None:
+    def test_load_cache_finds_either_format(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Load cache regardless of filename format."""
         # Test with old markdown format
         markdown_content = """---
@@ -855,11 +874,9 @@ Content
         # Test with legacy JSON format
         cache_file = tmp_path / "video1.json"
         cache_file.write_text(json.dumps({"video_id": "video1", "full_text": "Test"}))
+        monkeypatch.setattr("yt_summary.cache.MIGRATE_ON_LOAD", False)
 
-        with (
-            patch("yt_summary.cache.get_obsidian_vault_path", return_value=tmp_path),
-            patch("yt_summary.cache.save_to_cache"),
-        ):
+        with patch("yt_summary.cache.get_obsidian_vault_path", return_value=tmp_path):
             result = load_cache("video1")
         assert result is not None
 
@@ -4,12 +4,22 @@ import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from yt_summary.config import (
+    _is_writable,
     get_transcript_language,
     load_config,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_config_caches() -> None:
+    """Reset memoized config lookups so tests patching their dependencies see fresh results."""
+    load_config.cache_clear()
+    _is_writable.cache_clear()
+
+
 class TestLoadConfig:
     """Test loading configuration from .env file."""
 
@@ -79,6 +89,21 @@ class TestLoadConfig:
             # Should not raise error, just not load anything
             # load_dotenv might not be called or called with non-existent file
 
+    def test_load_config_reads_env_file_once(self) -> None:
+        """Skip re-reading .env on repeated calls within a process."""
+        with (
+            patch("yt_summary.config.load_dotenv") as mock_load,
+            patch("yt_summary.config.Path") as mock_path,
+        ):
+            mock_env = MagicMock()
+            mock_env.exists.return_value = True
+            mock_path.cwd.return_value.__truediv__.return_value = mock_env
+
+            load_config()
+            load_config()
+
+        mock_load.assert_called_once_with(mock_env)
+
 
 class TestGetTranscriptLanguage:
     """Test transcript language configuration."""
@@ -174,3 +199,19 @@ class TestGetObsidianVaultPath:
             pytest.raises(ValueError, match="not writable"),
         ):
             get_obsidian_vault_path()
+
+    def test_get_obsidian_vault_path_caches_writable_check(self, tmp_path: Path) -> None:
+        """Check write permission only once for repeated lookups of the same path."""
+        from yt_summary.config import get_obsidian_vault_path
+
+        vault_dir = tmp_path / "vault"
+        vault_dir.mkdir()
+
+        with (
+            patch("os.access", return_value=True) as mock_access,
+            patch.dict(os.environ, {"OBSIDIAN_VAULT_PATH": str(vault_dir)}),
+        ):
+            get_obsidian_vault_path()
+            get_obsidian_vault_path()
+
+        mock_access.assert_called_once()
@@ -1,200 +1,230 @@
 """Tests for main CLI application."""
 
+import logging
+import subprocess
 import sys
-from unittest.mock import patch
-
-from main import main
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+import main as main_module
+from main import main, parse_args, print_error
+from yt_summary.metadata import MetadataError
+from yt_summary.transcript import TranscriptError
+
+
+@pytest.fixture
+def mocked_main(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> SimpleNamespace:
+    """Patch main's logging, config, cache, metadata and transcript dependencies.
+
+    Defaults describe an uncached video; tests override return values as needed.
+    Functions whose results main() ignores get a plain Mock. INFO records are
+    captured so tests can assert on main's progress messages.
+    """
+    caplog.set_level(logging.INFO)
+    mocks = SimpleNamespace(
+        setup_logging=Mock(),
+        load_config=Mock(),
+        load_cache=MagicMock(return_value=None),
+        save_to_cache=Mock(),
+        is_legacy_filename=MagicMock(return_value=False),
+        fetch_video_metadata=MagicMock(
+            return_value={"title": "Amazing Tutorial", "channel": "Tech Channel"}
+        ),
+        fetch_transcript=MagicMock(return_value="Sample transcript"),
+    )
+    for name, mock in vars(mocks).items():
+        monkeypatch.setattr(main_module, name, mock)
+    return mocks
 
 
+@pytest.mark.usefixtures("mocked_main")
 class TestMain:
     """Test main CLI application."""
 
-    @patch("main.load_config")
-    @patch("main.load_cache", return_value=None)
-    @patch("main.save_to_cache")
-    @patch("main.fetch_transcript", return_value="Sample transcript")
-    def test_main_success(self, mock_fetch, mock_save, mock_cache, mock_load_config) -> None:
-        """Successfully run CLI with valid inputs."""
-        with patch.object(sys, "argv", ["main.py", "https://www.youtube.com/watch?v=dQw4w9WgXcQ"]):
-            result = main()
+    @pytest.mark.parametrize(
+        ("argv", "expected_lang"),
+        [
+            (["https://www.youtube.com/watch?v=dQw4w9WgXcQ"], "en"),
+            (["dQw4w9WgXcQ"], "en"),
+            (["https://www.youtube.com/watch?v=dQw4w9WgXcQ", "--lang", "es"], "es"),
+        ],
+        ids=["url", "bare_id", "lang_option"],
+    )
+    def test_main_success(self, mocked_main, argv, expected_lang) -> None:
+        """Fetch and cache transcript for a URL or bare ID in the requested language."""
+        result = main(argv)
 
         assert result == 0
-        mock_fetch.assert_called_once()
-        mock_save.assert_called()
-
-    @patch("main.load_config")
-    def test_main_invalid_url(self, mock_load_config) -> None:
-        """Exit with error for invalid URL."""
-        with patch.object(sys, "argv", ["main.py", "not-a-url"]):
-            result = main()
+        mocked_main.fetch_transcript.assert_called_once_with(
+            "dQw4w9WgXcQ", language_code=expected_lang
+        )
+        mocked_main.save_to_cache.assert_called()
+
+    @pytest.mark.parametrize(
+        "bad_input",
+        ["not-a-url", "abc123", "abc.def.ghi"],
+        ids=["not_a_url", "bare_id_too_short", "bare_id_with_dots"],
+    )
+    def test_main_invalid_input(self, mocked_main, bad_input, caplog) -> None:
+        """Reject input that is neither a YouTube URL nor an 11-char video ID."""
+        result = main([bad_input])
 
         assert result == 1
+        assert "Invalid YouTube URL or video ID" in caplog.text
+        mocked_main.load_cache.assert_not_called()
 
-    @patch("main.load_config")
-    @patch("main.load_cache", return_value=None)
-    @patch("main.fetch_transcript")
-    def test_main_transcript_fetch_error(self, mock_fetch, mock_cache, mock_load_config) -> None:
+    def test_main_transcript_fetch_error(self, mocked_main) -> None:
         """Exit with error when transcript fetch fails."""
-        from yt_summary.transcript import TranscriptError
+        mocked_main.fetch_transcript.side_effect = TranscriptError("No captions available")
 
-        mock_fetch.side_effect = TranscriptError("No captions available")
-
-        with patch.object(sys, "argv", ["main.py", "https://www.youtube.com/watch?v=dQw4w9WgXcQ"]):
-            result = main()
+        result = main(["https://www.youtube.com/watch?v=dQw4w9WgXcQ"])
 
         assert result == 1
 
-    @patch("main.setup_logging")
-    @patch("main.load_config")
-    @patch("main.load_cache")
-    @patch("main.fetch_transcript")
-    def test_main_with_cached_transcript(
-        self, mock_fetch, mock_cache, mock_load_config, mock_setup_logging, capsys, caplog
-    ) -> None:
+    def test_main_with_cached_transcript(self, mocked_main, caplog) -> None:
         """Skip fetch when transcript already cached."""
-        import logging
-
-        caplog.set_level(logging.INFO)
-        mock_cache.return_value = {
+        mocked_main.load_cache.return_value = {
             "video_id": "dQw4w9WgXcQ",
             "full_text": "cached transcript",
             "summary": "cached summary text",
         }
 
-        with patch.object(sys, "argv", ["main.py", "https://www.youtube.com/watch?v=dQw4w9WgXcQ"]):
-            result = main()
+        result = main(["https://www.youtube.com/watch?v=dQw4w9WgXcQ"])
 
         assert result == 0
-        mock_fetch.assert_not_called()
-        captured = capsys.readouterr()
-        assert "Transcript cached." in captured.out
+        mocked_main.fetch_transcript.assert_not_called()
+        assert "Transcript cached." in caplog.text
         assert "Transcript already cached for" in caplog.text
 
-    @patch("main.load_config")
-    @patch("main.load_cache")
-    def test_main_with_bare_video_id(self, mock_cache, mock_load_config, capsys) -> None:
-        """Accept a bare video ID instead of a full URL."""
-        mock_cache.return_value = {
-            "video_id": "dQw4w9WgXcQ",
+    @pytest.mark.parametrize(
+        "video_id",
+        ["dQw4w9WgXcQ", "aB1-_cD2-eF"],
+        ids=["alphanumeric", "hyphens_underscores"],
+    )
+    def test_main_with_bare_video_id(self, mocked_main, video_id) -> None:
+        """Accept a bare video ID, including hyphens and underscores, instead of a URL."""
+        mocked_main.load_cache.return_value = {
+            "video_id": video_id,
             "full_text": "cached transcript",
             "summary": "cached summary",
         }
 
-        with patch.object(sys, "argv", ["main.py", "dQw4w9WgXcQ"]):
-            result = main()
+        result = main([video_id])
 
         assert result == 0
-        mock_cache.assert_called_once_with("dQw4w9WgXcQ")
-
-    @patch("main.load_config")
-    @patch("main.load_cache", return_value=None)
-    @patch("main.save_to_cache")
-    @patch("main.fetch_transcript", return_value="Sample transcript")
-    def test_main_bare_video_id_full_flow(
-        self, mock_fetch, mock_save, mock_cache, mock_load_config
-    ) -> None:
-        """Bare video ID triggers full fetch+cache flow (no prior cache)."""
-        with patch.object(sys, "argv", ["main.py", "dQw4w9WgXcQ"]):
-            result = main()
+        mocked_main.load_cache.assert_called_once_with(video_id)
+        mocked_main.fetch_transcript.assert_not_called()
 
-        assert result == 0
-        mock_fetch.assert_called_once_with("dQw4w9WgXcQ", language_code="en")
-        mock_save.assert_called()
-
-    @patch("main.load_config")
-    @patch("main.load_cache")
-    def test_main_bare_video_id_with_hyphens_underscores(
-        self, mock_cache, mock_load_config, capsys
-    ) -> None:
-        """Bare video ID containing hyphens and underscores is accepted."""
-        mock_cache.return_value = {
-            "video_id": "aB1-_cD2-eF",
+    def test_main_uses_cached_transcript(self, mocked_main, caplog) -> None:
+        """Use cached transcript without fetching from YouTube."""
+        mocked_main.load_cache.return_value = {
+            "video_id": "dQw4w9WgXcQ",
             "full_text": "cached transcript",
-            "summary": "cached summary",
+            "summary": "",
         }
 
-        with patch.object(sys, "argv", ["main.py", "aB1-_cD2-eF"]):
-            result = main()
+        result = main(["https://www.youtube.com/watch?v=dQw4w9WgXcQ"])
 
         assert result == 0
-        mock_cache.assert_called_once_with("aB1-_cD2-eF")
-
-    @patch("main.load_config")
-    def test_main_invalid_bare_id_too_short(self, mock_load_config, caplog) -> None:
-        """Short string that is neither a valid URL nor a valid bare ID returns error."""
-        with patch.object(sys, "argv", ["main.py", "abc123"]):
-            result = main()
+        mocked_main.fetch_transcript.assert_not_called()
+        assert "Transcript already cached for" in caplog.text
 
-        assert result == 1
-        assert "Invalid YouTube URL or video ID" in caplog.text
+    def test_main_generic_exception(self, mocked_main) -> None:
+        """Exit with error for unexpected exceptions."""
+        mocked_main.fetch_transcript.side_effect = RuntimeError("Unexpected error")
 
-    @patch("main.load_config")
-    def test_main_invalid_bare_id_with_dots(self, mock_load_config, caplog) -> None:
-        """11-char string with invalid chars (dots) is rejected."""
-        with patch.object(sys, "argv", ["main.py", "abc.def.ghi"]):
-            result = main()
+        result = main(["https://www.youtube.com/watch?v=dQw4w9WgXcQ"])
 
         assert result == 1
-        assert "Invalid YouTube URL or video ID" in caplog.text
 
-    @patch("main.load_config")
-    @patch("main.load_cache", return_value=None)
-    @patch("main.save_to_cache")
-    @patch("main.fetch_transcript", return_value="Sample transcript")
-    def test_main_with_language_option(
-        self, mock_fetch, mock_save, mock_cache, mock_load_config
-    ) -> None:
-        """CLI accepts language option."""
-        with patch.object(
-            sys,
-            "argv",
-            [
-                "main.py",
-                "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
-                "--lang",
-                "es",
-            ],
-        ):
-            result = main()
+    def test_main_renames_legacy_cache_file(self, mocked_main) -> None:
+        """Rename legacy cache file when metadata is fetched."""
+        # Simulate cached transcript but legacy filename
+        mocked_main.is_legacy_filename.return_value = True
+        mocked_main.load_cache.return_value = {
+            "video_id": "dQw4w9WgXcQ",
+            "full_text": "cached transcript",
+            "summary": "cached summary",
+        }
+
+        result = main(["https://www.youtube.com/watch?v=dQw4w9WgXcQ"])
 
         assert result == 0
-        mock_fetch.assert_called_once_with("dQw4w9WgXcQ", language_code="es")
-
-    @patch("main.setup_logging")
-    @patch("main.load_config")
-    @patch("main.load_cache")
-    @patch("main.fetch_transcript")
-    def test_main_uses_cached_transcript(
-        self, mock_fetch, mock_cache, mock_load_config, mock_setup_logging, caplog
-    ) -> None:
-        """Use cached transcript without fetching from YouTube."""
-        import logging
+        # Should fetch metadata
+        mocked_main.fetch_video_metadata.assert_called_once_with("dQw4w9WgXcQ")
+        # Should save once under the new title and channel to rename the file
+        mocked_main.save_to_cache.assert_called_once_with(
+            "dQw4w9WgXcQ",
+            "cached transcript",
+            "cached summary",
+            title="Amazing Tutorial",
+            channel="Tech Channel",
+        )
+        # Legacy check walks the vault, so it should only run once
+        mocked_main.is_legacy_filename.assert_called_once_with("dQw4w9WgXcQ")
+
+    def test_main_renames_legacy_cache_file_from_cached_metadata(self, mocked_main) -> None:
+        """Rename legacy cache file without fetching metadata it already has."""
+        mocked_main.is_legacy_filename.return_value = True
+        mocked_main.load_cache.return_value = {
+            "video_id": "dQw4w9WgXcQ",
+            "full_text": "cached transcript",
+            "summary": "cached summary",
+            "title": "Amazing Tutorial",
+            "channel": "Tech Channel",
+        }
 
-        caplog.set_level(logging.INFO)
-        mock_cache.return_value = {
+        result = main(["https://www.youtube.com/watch?v=dQw4w9WgXcQ"])
+
+        assert result == 0
+        mocked_main.fetch_video_metadata.assert_not_called()
+        mocked_main.save_to_cache.assert_called_once_with(
+            "dQw4w9WgXcQ",
+            "cached transcript",
+            "cached summary",
+            title="Amazing Tutorial",
+            channel="Tech Channel",
+        )
+
+    def test_main_skips_rename_when_metadata_fetch_fails(self, mocked_main) -> None:
+        """Leave legacy cache file in place when metadata cannot be fetched."""
+        mocked_main.is_legacy_filename.return_value = True
+        mocked_main.load_cache.return_value = {
             "video_id": "dQw4w9WgXcQ",
             "full_text": "cached transcript",
-            "summary": "",
+            "summary": "cached summary",
         }
+        mocked_main.fetch_video_metadata.side_effect = MetadataError(
+            "Network error", video_id="dQw4w9WgXcQ"
+        )
 
-        with patch.object(sys, "argv", ["main.py", "https://www.youtube.com/watch?v=dQw4w9WgXcQ"]):
-            result = main()
+        result = main(["https://www.youtube.com/watch?v=dQw4w9WgXcQ"])
 
         assert result == 0
-        mock_fetch.assert_not_called()
-        assert "Transcript already cached for" in caplog.text
+        mocked_main.save_to_cache.assert_not_called()
 
-    @patch("main.load_config")
-    @patch("main.load_cache", return_value=None)
-    @patch("main.fetch_transcript")
-    def test_main_generic_exception(self, mock_fetch, mock_cache, mock_load_config) -> None:
-        """Exit with error for unexpected exceptions."""
-        mock_fetch.side_effect = RuntimeError("Unexpected error")
+    def test_main_does_not_rename_new_format_cache(self, mocked_main, caplog) -> None:
+        """Do not fetch metadata when cache already has new format filename."""
+        # Simulate cached with title and channel already in filename
+        mocked_main.load_cache.return_value = {
+            "video_id": "dQw4w9WgXcQ",
+            "full_text": "cached transcript",
+            "summary": "cached summary",
+            "title": "Amazing Tutorial",
+            "channel": "Tech Channel",
+        }
 
-        with patch.object(sys, "argv", ["main.py", "https://www.youtube.com/watch?v=dQw4w9WgXcQ"]):
-            result = main()
+        result = main(["https://www.youtube.com/watch?v=dQw4w9WgXcQ"])
 
-        assert result == 1
+        assert result == 0
+        # Should NOT fetch metadata since file already has new format
+        mocked_main.fetch_video_metadata.assert_not_called()
+        assert "Transcript cached." in caplog.text
 
 
 class TestParseArgs:
@@ -202,38 +232,28 @@ class TestParseArgs:
 
     def test_parse_args_with_url_only(self) -> None:
         """Parse arguments with only URL."""
-        from main import parse_args
-
         args = parse_args(["https://www.youtube.com/watch?v=dQw4w9WgXcQ"])
         assert args.url_or_id == "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
         assert args.lang is None
 
     def test_parse_args_with_bare_video_id(self) -> None:
         """Parse arguments with bare video ID."""
-        from main import parse_args
-
         args = parse_args(["dQw4w9WgXcQ"])
         assert args.url_or_id == "dQw4w9WgXcQ"
 
     def test_parse_args_with_lang_option(self) -> None:
         """Parse arguments with language option."""
-        from main import parse_args
-
         args = parse_args(["https://youtu.be/abc123", "--lang", "es"])
         assert args.lang == "es"
 
     def test_parse_args_with_explicit_args_list(self) -> None:
         """Parse args from explicit list without using sys.argv."""
-        from main import parse_args
-
         args = parse_args(["https://www.youtube.com/watch?v=dQw4w9WgXcQ", "--lang", "es"])
         assert args.url_or_id == "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
         assert args.lang == "es"
 
     def test_parse_args_with_bare_id_and_lang(self) -> None:
         """Parse bare video ID with lang option."""
-        from main import parse_args
-
         args = parse_args(["dQw4w9WgXcQ", "--lang", "en"])
         assert args.url_or_id == "dQw4w9WgXcQ"
         assert args.lang == "en"
@@ -244,69 +264,51 @@ class TestPrintError:
 
     def test_print_error_writes_to_stderr(self, caplog) -> None:
         """Print error message to logger."""
-        from main import print_error
-
         print_error("Test error message")
         assert "Test error message" in caplog.text
 
-    @patch("main.load_config")
-    @patch("main.is_legacy_filename", return_value=True)
-    @patch("main.load_cache")
-    @patch(
-        "main.fetch_video_metadata",
-        return_value={"title": "Amazing Tutorial", "channel": "Tech Channel"},
-    )
-    @patch("main.save_to_cache")
-    def test_main_renames_legacy_cache_file(
-        self, mock_save, mock_fetch_metadata, mock_cache, mock_is_legacy, mock_load_config
-    ) -> None:
-        """Rename legacy cache file when metadata is fetched."""
-        # Simulate cached transcript but legacy filename
-        mock_cache.return_value = {
-            "video_id": "dQw4w9WgXcQ",
-            "full_text": "cached transcript",
-            "summary": "cached summary",
-        }
-
-        with patch.object(sys, "argv", ["main.py", "https://www.youtube.com/watch?v=dQw4w9WgXcQ"]):
-            result = main()
-
-        assert result == 0
-        # Should fetch metadata
-        mock_fetch_metadata.assert_called_once_with("dQw4w9WgXcQ")
-        # Should save to rename the file
-        assert mock_save.call_count >= 1
-        # Check that save was called with the title and channel
-        save_calls = [
-            call
-            for call in mock_save.call_args_list
-            if call[1].get("title") == "Amazing Tutorial"
-            and call[1].get("channel") == "Tech Channel"
-        ]
-        assert len(save_calls) > 0
-
-    @patch("main.load_config")
-    @patch("main.is_legacy_filename", return_value=False)
-    @patch("main.load_cache")
-    @patch("main.fetch_video_metadata")
-    def test_main_does_not_rename_new_format_cache(
-        self, mock_fetch_metadata, mock_cache, mock_is_legacy, mock_load_config, capsys
-    ) -> None:
-        """Do not fetch metadata when cache already has new format filename."""
-        # Simulate cached with title and channel already in filename
-        mock_cache.return_value = {
-            "video_id": "dQw4w9WgXcQ",
-            "full_text": "cached transcript",
-            "summary": "cached summary",
-            "title": "Amazing Tutorial",
-            "channel": "Tech Channel",
-        }
-
-        with patch.object(sys, "argv", ["main.py", "https://www.youtube.com/watch?v=dQw4w9WgXcQ"]):
-            result = main()
 
-        assert result == 0
-        # Should NOT fetch metadata since file already has new format
-        mock_fetch_metadata.assert_not_called()
-        captured = capsys.readouterr()
-        assert "Transcript cached." in captured.out
+class TestLazyImports:
+    """Test deferred import of yt-dlp dependent modules."""
+
+    def test_import_main_does_not_load_yt_dlp(self) -> None:
+        """Importing main leaves yt-dlp unloaded until a video is processed."""
+        result = subprocess.run(
+            [sys.executable, "-c", "import sys, main; print('yt_dlp' in sys.modules)"],
+            cwd=Path(__file__).parent.parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "False"
+
+    @pytest.mark.parametrize("argv", [["--help"], ["not-a-url"]])
+    def test_early_exit_does_not_load_yt_dlp(self, argv) -> None:
+        """--help and invalid input return before yt-dlp is imported."""
+        code = (
+            "import sys, main\n"
+            "try:\n"
+            f"    main.main({argv!r})\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print('yt_dlp' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).parent.parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.splitlines()[-1] == "False"
+
+    def test_lazy_name_resolves_to_real_object(self) -> None:
+        """Accessing a lazy name returns the object from its defining module."""
+        from yt_summary.transcript import fetch_transcript
+
+        assert main_module.fetch_transcript is fetch_transcript
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Unknown module attributes still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            main_module.does_not_exist  # noqa: B018
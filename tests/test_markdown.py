@@ -143,8 +143,8 @@ PROTOCOLS & INSTRUCTIONS:
         match = re.search(r"cached_at: (.+)", result)
         assert match
         timestamp_str = match.group(1)
-        # Should be parseable as ISO format
-        datetime.fromisoformat(timestamp_str)
+        # Should be parseable as ISO format, at whole-second precision
+        assert datetime.fromisoformat(timestamp_str).microsecond == 0
 
     def test_generate_markdown_preserves_newlines(self) -> None:
         """Preserve newlines in transcript and summary."""
@@ -425,6 +425,25 @@ url: https://example.com"""
         result = _extract_frontmatter_field(frontmatter, "title")
         assert result == "Lots of Spaces"
 
+    def test_extract_frontmatter_field_quoted_value_with_colon(self) -> None:
+        """Strip surrounding quotes and keep colons inside the value."""
+        frontmatter = 'title: "Part 1: The Basics"'
+
+        assert _extract_frontmatter_field(frontmatter, "title") == "Part 1: The Basics"
+
+    def test_extract_frontmatter_field_legacy_unescaped_quotes(self) -> None:
+        """Read quoted values written before quotes inside them were escaped."""
+        frontmatter = 'title: "The "Best" Video"'
+
+        assert _extract_frontmatter_field(frontmatter, "title") == 'The "Best" Video'
+
+    def test_extract_frontmatter_field_empty_value(self) -> None:
+        """Empty field value does not pick up the following line."""
+        frontmatter = "channel:\nread: false"
+
+        assert _extract_frontmatter_field(frontmatter, "channel") == ""
+        assert _extract_frontmatter_field(frontmatter, "read") == "false"
+
 
 class TestExtractSection:
     """Test extracting markdown sections."""
@@ -514,6 +533,17 @@ Next content.
 
         assert result == "Paragraph 1\n\nParagraph 2"
 
+    def test_extract_section_empty_does_not_swallow_next_header(self) -> None:
+        """Empty section returns empty string rather than the following section."""
+        content = """## Summary
+
+## Next
+
+Next content.
+"""
+        assert _extract_section(content, "Summary") == ""
+        assert _extract_section(content, "Next") == "Next content."
+
 
 class TestRoundTrip:
     """Test round-trip conversion (generate -> parse)."""
@@ -597,3 +627,20 @@ PROTOCOLS & INSTRUCTIONS:
         assert parsed["title"] == "世界 Test 🌍"
         assert "émojis 🎉" in parsed["full_text"]
         assert "世界" in parsed["summary"]
+
+    def test_roundtrip_with_quotes_and_backslashes(self) -> None:
+        """Round-trip title and channel containing quotes and backslashes."""
+        markdown = generate_markdown(
+            "abc123",
+            'The "Best" C:\\Users Tip',
+            "Transcript text.",
+            "SUMMARY:\nSummary text.",
+            channel='Dave\'s "Tech"',
+        )
+
+        assert 'title: "The \\"Best\\" C:\\\\Users Tip"' in markdown
+
+        parsed = parse_markdown(markdown)
+
+        assert parsed["title"] == 'The "Best" C:\\Users Tip'
+        assert parsed["channel"] == 'Dave\'s "Tech"'
@@ -339,6 +339,21 @@ class TestExtractSubtitles:
         with pytest.raises(_PermanentError, match="No subtitles found"):
             _extract_subtitles("https://youtube.com/watch?v=test", "test", "en")
 
+    @patch("yt_summary.transcript.yt_dlp.YoutubeDL")
+    def test_skips_manifests_but_keeps_translated_subs(self, mock_ydl_cls) -> None:
+        """Skip HLS/DASH manifests while still requesting translated captions."""
+        mock_ydl = MagicMock()
+        mock_ydl.__enter__ = Mock(return_value=mock_ydl)
+        mock_ydl.__exit__ = Mock(return_value=False)
+        mock_ydl.extract_info.return_value = {"subtitles": {}, "automatic_captions": {}}
+        mock_ydl_cls.return_value = mock_ydl
+
+        with pytest.raises(_PermanentError):
+            _extract_subtitles("https://youtube.com/watch?v=test", "test", "en")
+
+        ydl_opts = mock_ydl_cls.call_args.args[0]
+        assert ydl_opts["extractor_args"] == {"youtube": {"skip": ["hls", "dash"]}}
+
 
 class TestErrorClassification:
     """Test error classification for permanent vs transient errors."""
@@ -260,3 +260,8 @@ class TestIsVideoId:
     def test_colon_in_id_returns_false(self) -> None:
         """Reject strings with colons (URL-like)."""
         assert not is_video_id("http:abcdef")
+
+    def test_non_ascii_letters_returns_false(self) -> None:
+        """Reject non-ASCII letters and digits even if 11 chars."""
+        assert not is_video_id("dQw4w9WgXcé")
+        assert not is_video_id("dQw4w9WgXc٣")
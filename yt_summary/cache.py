@@ -8,6 +8,9 @@ from yt_summary.markdown import generate_markdown, parse_markdown
 
 __all__ = ["load_cache", "save_to_cache", "is_legacy_filename"]
 
+# Rewrite legacy JSON cache files as markdown when they are loaded
+MIGRATE_ON_LOAD: bool = True
+
 
 def _get_cache_dir() -> Path:
     """Get the cache directory path from configuration."""
@@ -109,7 +112,7 @@ def _local_load_cache(video_id: str) -> dict | None:
     """Load cached data for a video from local filesystem.
 
     Supports markdown (.md) and JSON (.json) formats.
-    Automatically migrates JSON files to markdown on load.
+    Automatically migrates JSON files to markdown on load unless MIGRATE_ON_LOAD is False.
 
     Args:
         video_id: YouTube video ID
@@ -132,12 +135,13 @@ def _local_load_cache(video_id: str) -> dict | None:
         full_text = json_data.get("full_text", "")
         summary = json_data.get("summary", "")
 
-        # Convert to markdown and save
-        if full_text or summary:
-            save_to_cache(video_id, full_text, summary, title, channel)
+        if MIGRATE_ON_LOAD:
+            # Convert to markdown and save
+            if full_text or summary:
+                save_to_cache(video_id, full_text, summary, title, channel)
 
-        # Delete old JSON file
-        cache_file.unlink()
+            # Delete old JSON file
+            cache_file.unlink()
 
         # Add channel to result if it wasn't in JSON
         if "channel" not in json_data:
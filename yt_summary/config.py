@@ -1,13 +1,18 @@
 """Configuration management for the application."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 from dotenv import load_dotenv
 
 
+@lru_cache(maxsize=1)
 def load_config() -> None:
-    """Load environment variables from .env file if it exists."""
+    """Load environment variables from .env file if it exists.
+
+    Only the first call in a process reads the file; later calls are no-ops.
+    """
     env_file = Path.cwd() / ".env"
     if env_file.exists():
         load_dotenv(env_file)
@@ -24,6 +29,12 @@ def get_transcript_language() -> str:
     return os.getenv("TRANSCRIPT_LANGUAGE", "en")
 
 
+@lru_cache(maxsize=128)
+def _is_writable(path: Path) -> bool:
+    """Check write permission for a path, cached since it rarely changes within a process."""
+    return os.access(path, os.W_OK)
+
+
 def get_obsidian_vault_path() -> Path:
     """Get the Obsidian vault path from environment, with fallback to cache/ directory.
 
@@ -54,7 +65,7 @@ def get_obsidian_vault_path() -> Path:
             )
 
         # Validate path is writable
-        if not os.access(vault_path, os.W_OK):
+        if not _is_writable(vault_path):
             raise ValueError(
                 f"Obsidian vault path is not writable: {vault_path}\n"
                 "Please check directory permissions"
@@ -1,9 +1,25 @@
 """Markdown formatting utilities for Obsidian integration."""
 
+import json
 import re
 from datetime import datetime, timezone
 from typing import TypedDict
 
+# Frontmatter block at the top of a cached markdown file
+_FRONTMATTER_RE = re.compile(r"^---\n(.*?)\n---\n", re.DOTALL)
+
+# Section headers in the plain-text summary format
+_SUMMARY_HEADER = "SUMMARY:"
+_TAKEAWAYS_HEADER = "TOP TAKEAWAYS:"
+_PROTOCOLS_HEADER = "PROTOCOLS & INSTRUCTIONS:"
+
+# Blank line followed by one of the summary section headers
+_SUMMARY_SPLIT_RE = re.compile(
+    r"\n\n(?="
+    + "|".join(map(re.escape, (_SUMMARY_HEADER, _TAKEAWAYS_HEADER, _PROTOCOLS_HEADER)))
+    + ")"
+)
+
 
 class ParsedMarkdown(TypedDict):
     """Typed structure returned by parse_markdown."""
@@ -36,14 +52,16 @@ def generate_markdown(
     summary_section, takeaways_section, protocols_section = _parse_summary_sections(summary)
 
     # Generate YAML frontmatter
-    timestamp = datetime.now(timezone.utc).isoformat()
+    timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
     frontmatter_lines = [
         "---",
         f"video_id: {video_id}",
-        f'title: "{title}"',
+        # json.dumps escapes embedded quotes and backslashes, and its output is a
+        # valid YAML double-quoted scalar
+        f"title: {json.dumps(title, ensure_ascii=False)}",
     ]
     if channel:
-        frontmatter_lines.append(f'channel: "{channel}"')
+        frontmatter_lines.append(f"channel: {json.dumps(channel, ensure_ascii=False)}")
     frontmatter_lines.extend(
         [
             f"url: https://www.youtube.com/watch?v={video_id}",
@@ -53,10 +71,9 @@ def generate_markdown(
             "---",
         ]
     )
-    frontmatter = "\n".join(frontmatter_lines) + "\n"
 
-    # Build markdown content
-    content_parts = [frontmatter, f"# {title}", ""]
+    # Build markdown content, joined once with the frontmatter
+    content_parts = [*frontmatter_lines, "", f"# {title}", ""]
 
     # Add summary section
     if summary_section:
@@ -86,7 +103,7 @@ def parse_markdown(markdown_content: str) -> ParsedMarkdown:
         Dictionary with video_id, title, full_text, and summary
     """
     # Extract frontmatter
-    frontmatter_match = re.match(r"^---\n(.*?)\n---\n", markdown_content, re.DOTALL)
+    frontmatter_match = _FRONTMATTER_RE.match(markdown_content)
     if not frontmatter_match:
         raise ValueError("Invalid markdown: missing frontmatter")
 
@@ -94,26 +111,28 @@ def parse_markdown(markdown_content: str) -> ParsedMarkdown:
     content = markdown_content[frontmatter_match.end() :]
 
     # Parse frontmatter fields
-    video_id = _extract_frontmatter_field(frontmatter, "video_id")
-    title = _extract_frontmatter_field(frontmatter, "title")
-    channel = _extract_frontmatter_field(frontmatter, "channel")
-    read_raw = _extract_frontmatter_field(frontmatter, "read")
-    starred_raw = _extract_frontmatter_field(frontmatter, "starred")
+    fields = _parse_frontmatter(frontmatter)
+    video_id = fields.get("video_id", "")
+    title = fields.get("title", "")
+    channel = fields.get("channel", "")
+    read_raw = fields.get("read", "")
+    starred_raw = fields.get("starred", "")
 
     # Extract sections from content
-    summary_text = _extract_section(content, "Summary")
-    takeaways_text = _extract_section(content, "Top Takeaways")
-    protocols_text = _extract_section(content, "Protocols & Instructions")
-    transcript_text = _extract_section(content, "Full Transcript")
+    sections = _split_sections(content)
+    summary_text = sections.get("Summary", "")
+    takeaways_text = sections.get("Top Takeaways", "")
+    protocols_text = sections.get("Protocols & Instructions", "")
+    transcript_text = sections.get("Full Transcript", "")
 
     # Reconstruct original summary format
     summary_parts = []
     if summary_text:
-        summary_parts.append(f"SUMMARY:\n{summary_text}")
+        summary_parts.append(f"{_SUMMARY_HEADER}\n{summary_text}")
     if takeaways_text:
-        summary_parts.append(f"TOP TAKEAWAYS:\n{takeaways_text}")
+        summary_parts.append(f"{_TAKEAWAYS_HEADER}\n{takeaways_text}")
     if protocols_text:
-        summary_parts.append(f"PROTOCOLS & INSTRUCTIONS:\n{protocols_text}")
+        summary_parts.append(f"{_PROTOCOLS_HEADER}\n{protocols_text}")
 
     summary = "\n\n".join(summary_parts)
 
@@ -142,20 +161,46 @@ def _parse_summary_sections(summary: str) -> tuple[str, str, str]:
     protocols_text = ""
 
     # Split by section headers
-    parts = re.split(r"\n\n(?=SUMMARY:|TOP TAKEAWAYS:|PROTOCOLS & INSTRUCTIONS:)", summary)
+    parts = _SUMMARY_SPLIT_RE.split(summary)
 
     for part in parts:
         part = part.strip()
-        if part.startswith("SUMMARY:"):
-            summary_text = part[len("SUMMARY:") :].strip()
-        elif part.startswith("TOP TAKEAWAYS:"):
-            takeaways_text = part[len("TOP TAKEAWAYS:") :].strip()
-        elif part.startswith("PROTOCOLS & INSTRUCTIONS:"):
-            protocols_text = part[len("PROTOCOLS & INSTRUCTIONS:") :].strip()
+        if part.startswith(_SUMMARY_HEADER):
+            summary_text = part.removeprefix(_SUMMARY_HEADER).strip()
+        elif part.startswith(_TAKEAWAYS_HEADER):
+            takeaways_text = part.removeprefix(_TAKEAWAYS_HEADER).strip()
+        elif part.startswith(_PROTOCOLS_HEADER):
+            protocols_text = part.removeprefix(_PROTOCOLS_HEADER).strip()
 
     return summary_text, takeaways_text, protocols_text
 
 
+def _parse_frontmatter(frontmatter: str) -> dict[str, str]:
+    """Parse all fields from YAML frontmatter in a single pass.
+
+    Args:
+        frontmatter: YAML frontmatter content
+
+    Returns:
+        Mapping of field name to value, with double-quoted values unescaped.
+        If a field appears more than once, the first value wins.
+    """
+    fields: dict[str, str] = {}
+    for line in frontmatter.splitlines():
+        name, sep, value = line.partition(":")
+        if not sep or name in fields:
+            continue
+        value = value.strip()
+        if len(value) >= 2 and value[0] == '"' and value[-1] == '"':
+            try:
+                value = json.loads(value)
+            except json.JSONDecodeError:
+                # Files written before values were escaped hold raw text in quotes
+                value = value[1:-1]
+        fields[name] = value
+    return fields
+
+
 def _extract_frontmatter_field(frontmatter: str, field_name: str) -> str:
     """Extract a field value from YAML frontmatter.
 
@@ -166,14 +211,30 @@ def _extract_frontmatter_field(frontmatter: str, field_name: str) -> str:
     Returns:
         Field value or empty string if not found
     """
-    pattern = rf"^{field_name}:\s*(.+)$"
-    match = re.search(pattern, frontmatter, re.MULTILINE)
-    if not match:
-        return ""
-    value = match.group(1).strip()
-    if len(value) >= 2 and value[0] == '"' and value[-1] == '"':
-        value = value[1:-1]
-    return value
+    return _parse_frontmatter(frontmatter).get(field_name, "")
+
+
+def _split_sections(content: str) -> dict[str, str]:
+    """Split markdown content into its ## sections in a single pass.
+
+    A section runs from its "## Name" header, which must be followed by a blank
+    line, up to the next "## " header or the end of the content.
+
+    Args:
+        content: Markdown content
+
+    Returns:
+        Mapping of section header (without ##) to stripped section content.
+        If a header appears more than once, the first section wins.
+    """
+    sections: dict[str, str] = {}
+    # Prefix a newline so a header on the first line splits like any other
+    for chunk in ("\n" + content).split("\n## ")[1:]:
+        name, sep, body = chunk.partition("\n\n")
+        if not sep or "\n" in name or name in sections:
+            continue
+        sections[name] = body.strip()
+    return sections
 
 
 def _extract_section(content: str, section_name: str) -> str:
@@ -186,7 +247,4 @@ def _extract_section(content: str, section_name: str) -> str:
     Returns:
         Section content or empty string if not found
     """
-    # Match section header and capture content until next header or end
-    pattern = rf"^## {re.escape(section_name)}\n\n(.*?)(?=\n## |\Z)"
-    match = re.search(pattern, content, re.DOTALL | re.MULTILINE)
-    return match.group(1).strip() if match else ""
+    return _split_sections(content).get(section_name, "")
@@ -2,9 +2,13 @@
 
 import os
 import re
+from functools import lru_cache
 
 import yt_dlp
 
+# Characters that are invalid in filenames on common filesystems
+_INVALID_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+
 
 class MetadataError(Exception):
     """Exception raised when metadata cannot be fetched."""
@@ -16,11 +20,14 @@ class MetadataError(Exception):
         super().__init__(message)
 
 
+@lru_cache(maxsize=256)
 def sanitize_filename(title: str) -> str:
     """
     Sanitize video title for use in filename.
 
-    Removes or replaces characters that are invalid in filenames.
+    Removes or replaces characters that are invalid in filenames. Results are
+    cached, since the cache layer re-sanitizes the title and channel already
+    sanitized here.
 
     Args:
         title: Raw video title
@@ -29,12 +36,9 @@ def sanitize_filename(title: str) -> str:
         Sanitized title safe for filenames
     """
     # Replace invalid filename characters with space
-    sanitized = re.sub(r'[<>:"/\\|?*]', " ", title)
-    # Replace multiple spaces with single space
-    sanitized = re.sub(r"\s+", " ", sanitized)
-    # Trim whitespace and limit length
-    sanitized = sanitized.strip()[:200]
-    return sanitized
+    sanitized = _INVALID_FILENAME_CHARS_RE.sub(" ", title)
+    # Collapse whitespace runs to a single space and trim, then limit length
+    return " ".join(sanitized.split())[:200]
 
 
 def fetch_video_metadata(video_id: str) -> dict[str, str]:
@@ -60,6 +64,10 @@ def fetch_video_metadata(video_id: str) -> dict[str, str]:
             "extract_flat": False,
             "format": "best",
             "ignore_no_formats_error": True,
+            # Title and uploader come from the player response; skip the HLS/DASH
+            # manifest requests and translated caption lookups that only matter
+            # for downloads
+            "extractor_args": {"youtube": {"skip": ["hls", "dash", "translated_subs"]}},
         }
 
         cookies_file = os.getenv("YOUTUBE_COOKIES_FILE")
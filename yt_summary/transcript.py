@@ -31,6 +31,15 @@ class _PermanentError(Exception):
 _MAX_RETRIES = 3
 _BASE_DELAY = 2.0
 
+# Lowercase fragments of yt-dlp error messages that will not succeed on retry
+_PERMANENT_ERROR_PATTERNS = (
+    "video unavailable",
+    "private video",
+    "sign in to confirm your age",
+    "this video is not available",
+    "this video has been removed",
+)
+
 
 def _parse_webvtt(content: str) -> str:
     """
@@ -160,6 +169,9 @@ def _extract_subtitles(url: str, video_id: str, language_code: str) -> str:
         "writeautomaticsub": True,
         "format": "best",
         "ignore_no_formats_error": True,
+        # Skip the HLS/DASH manifest requests; only caption tracks are needed. Translated
+        # captions stay enabled since they feed the language fallback
+        "extractor_args": {"youtube": {"skip": ["hls", "dash"]}},
     }
 
     cookies_file = os.getenv("YOUTUBE_COOKIES_FILE")
@@ -223,14 +235,7 @@ def _is_permanent_error(e: Exception) -> bool:
 
     if isinstance(e, yt_dlp.utils.DownloadError):
         error_msg = str(e).lower()
-        permanent_patterns = [
-            "video unavailable",
-            "private video",
-            "sign in to confirm your age",
-            "this video is not available",
-            "this video has been removed",
-        ]
-        return any(pattern in error_msg for pattern in permanent_patterns)
+        return any(pattern in error_msg for pattern in _PERMANENT_ERROR_PATTERNS)
 
     return False
 
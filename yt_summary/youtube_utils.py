@@ -1,6 +1,15 @@
 """YouTube URL parsing and validation utilities."""
 
 import re
+import string
+
+_VIDEO_ID_LENGTH = 11
+_VIDEO_ID_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+
+# Matches youtube.com/watch?v=..., youtu.be/... and youtube.com/watch?...&v=...
+_VIDEO_URL_RE = re.compile(
+    r"(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/watch\?.*&v=)([a-zA-Z0-9_-]{11})"
+)
 
 
 def extract_video_id(url: str) -> str | None:
@@ -18,10 +27,7 @@ def extract_video_id(url: str) -> str | None:
     Returns:
         Video ID if valid URL, None otherwise
     """
-    # Pattern for youtube.com/watch?v=...
-    match = re.search(
-        r"(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/watch\?.*&v=)([a-zA-Z0-9_-]{11})", url
-    )
+    match = _VIDEO_URL_RE.search(url)
     if match:
         return match.group(1)
     return None
@@ -29,7 +35,7 @@ def extract_video_id(url: str) -> str | None:
 
 def is_video_id(value: str) -> bool:
     """Check if a string is a bare YouTube video ID (11 chars, valid characters)."""
-    return bool(re.fullmatch(r"[a-zA-Z0-9_-]{11}", value))
+    return len(value) == _VIDEO_ID_LENGTH and _VIDEO_ID_CHARS.issuperset(value)
 
 
 def is_valid_youtube_url(url: str) -> bool: